@@ -0,0 +1,103 @@
+"""
+测量 graph_memory 的冷启动耗时：模块导入时间、MemoryGraph 初始化时间，以及各客户端首次使用时的创建时间。
+导入在全新的 Python 进程中测量；初始化不应连接 Neo4j，也不应创建 embedder 或 LLM 客户端。
+首次使用需要可访问的 Neo4j（密码用环境变量 NEO4J_PASSWORD）和 embedder/LLM 的凭据，失败时只报告错误。
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+REPEAT = 5
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+IMPORT_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import graph_memory
+elapsed = time.perf_counter() - start
+eager = [name for name in ("neo4j", "rank_bm25") if name in sys.modules]
+print(elapsed, ",".join(eager))
+"""
+
+
+def measure_import():
+    timings = []
+    eager_modules = set()
+    for _ in range(REPEAT):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET], capture_output=True, text=True, check=True, cwd=HERE
+        ).stdout.split()
+        timings.append(float(output[0]))
+        if len(output) > 1:
+            eager_modules.update(output[1].split(","))
+    return timings, eager_modules
+
+
+def make_config():
+    return SimpleNamespace(
+        graph_store=SimpleNamespace(
+            config=SimpleNamespace(
+                url="bolt://localhost:7687",
+                username="neo4j",
+                password=os.environ.get("NEO4J_PASSWORD", "unused"),
+                database="neo4j",
+                base_label=True,
+            ),
+            llm=None,
+            custom_prompt=None,
+        ),
+        llm=SimpleNamespace(provider="openai", config={}),
+        embedder=SimpleNamespace(provider="openai", config={}),
+        vector_store=SimpleNamespace(config={}),
+    )
+
+
+def measure_init():
+    from graph_memory import MemoryGraph
+
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        MemoryGraph(make_config())
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def measure_first_use():
+    """
+    Times the deferred creation of each client; the first graph access also connects and runs the index DDL.
+    The graph is only timed once a trivial query succeeds, so an unreachable server is reported as a failure.
+    """
+    from graph_memory import MemoryGraph
+
+    memory_graph = MemoryGraph(make_config())
+    results = {}
+    for name in ("graph", "embedding_model", "llm"):
+        start = time.perf_counter()
+        try:
+            client = getattr(memory_graph, name)
+            if name == "graph":
+                client.query("RETURN 1")
+            results[name] = time.perf_counter() - start
+        except Exception as e:
+            results[name] = e
+    return results
+
+
+import_timings, eager_modules = measure_import()
+init_timings = measure_init()
+first_use = measure_first_use()
+
+print(f"📦 导入 graph_memory: 中位数 {statistics.median(import_timings) * 1000:.1f} ms ({REPEAT} 次)")
+print(f"🚀 初始化 MemoryGraph: 中位数 {statistics.median(init_timings) * 1000:.3f} ms ({REPEAT} 次)")
+for name, result in first_use.items():
+    if isinstance(result, Exception):
+        print(f"❌ 首次使用 {name}: 失败 ({type(result).__name__}: {result})")
+    else:
+        print(f"⏱️ 首次使用 {name}: {result * 1000:.1f} ms")
+if eager_modules:
+    print(f"⚠️ 导入时提前加载了: {', '.join(sorted(eager_modules))}")
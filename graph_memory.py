@@ -1,17 +1,15 @@
+import atexit
+import hashlib
 import logging
+import math
+import struct
+import threading
+from array import array
+from typing import Literal, Optional
 
-from mem0.memory.utils import format_entities
-
-try:
-    from langchain_neo4j import Neo4jGraph
-except ImportError:
-    raise ImportError("langchain_neo4j is not installed. Please install it using pip install langchain-neo4j")
-
-try:
-    from rank_bm25 import BM25Okapi
-except ImportError:
-    raise ImportError("rank_bm25 is not installed. Please install it using pip install rank-bm25")
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from mem0.memory.utils import format_entities
 from mem0.graphs.tools import (
     DELETE_MEMORY_STRUCT_TOOL_GRAPH,
     DELETE_MEMORY_TOOL_GRAPH,
@@ -26,34 +24,184 @@ from mem0.utils.factory import EmbedderFactory, LlmFactory
 logger = logging.getLogger(__name__)
 
 
+class MemoryGraphOptions(BaseModel):
+    """Options of MemoryGraph that are not part of mem0's graph store config."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    embedding_quantization: Optional[Literal["float16", "int8"]] = Field(
+        None, description="Precision of the full embedding stored in `embedding_q` for exact re-scoring"
+    )
+    embedding_coarse_dims: Optional[int] = Field(
+        None,
+        gt=0,
+        description="Number of leading dimensions kept in `embedding` for the coarse scan. Only sound for "
+        "Matryoshka-trained embedders",
+    )
+    embedding_rescore_candidates: int = Field(
+        100, gt=0, description="Number of coarse candidates re-scored exactly when looking up a single node"
+    )
+    max_connection_pool_size: Optional[int] = Field(
+        None, gt=0, description="Connection pool size of the Neo4j driver shared per url, user and database"
+    )
+    warm_up: bool = Field(
+        False, description="Create the Neo4j connection, embedder and LLM clients in background threads on init"
+    )
+
+    @model_validator(mode="after")
+    def check_compact_embedding_storage(self):
+        if (self.embedding_quantization is None) != (self.embedding_coarse_dims is None):
+            raise ValueError(
+                "Compact embedding storage needs both 'embedding_quantization' and 'embedding_coarse_dims'."
+            )
+        return self
+
+
+class _SharedGraph:
+    """A neo4j driver (and connection pool) shared by every MemoryGraph using the same connection settings."""
+
+    def __init__(self, url, username, password, database, max_connection_pool_size=None):
+        try:
+            from neo4j import GraphDatabase
+        except ImportError:
+            raise ImportError("neo4j is not installed. Please install it using pip install neo4j")
+
+        driver_config = {"notifications_min_severity": "OFF"}
+        if max_connection_pool_size:
+            driver_config["max_connection_pool_size"] = max_connection_pool_size
+        self.driver = GraphDatabase.driver(url, auth=(username, password), **driver_config)
+        try:
+            self.driver.verify_connectivity()
+        except Exception:
+            self.driver.close()
+            raise
+        self.database = database
+        self.closed = False
+
+    def query(self, query, params=None):
+        """Runs a query on the leader and returns its records as dictionaries."""
+        return self._execute(query, params, read=False)
+
+    def read_query(self, query, params=None):
+        """
+        Runs a read-only query that cluster routing may serve from a follower or read replica.
+
+        Reads and writes share the driver's default bookmark manager, so reads observe earlier writes.
+        """
+        return self._execute(query, params, read=True)
+
+    def _execute(self, query, params, read):
+        from neo4j import RoutingControl
+
+        records, _, _ = self.driver.execute_query(
+            query,
+            parameters_=params or {},
+            database_=self.database,
+            routing_=RoutingControl.READ if read else RoutingControl.WRITE,
+        )
+        return [record.data() for record in records]
+
+    def close(self):
+        self.closed = True
+        self.driver.close()
+
+
+# Process-wide drivers keyed by their connection settings (see `_get_shared_graph`), and the schema setups keyed by
+# (url, username, database) that already ran in this process
+_graphs = {}
+_graphs_lock = threading.Lock()
+_graph_locks = {}
+_schema_locks = {}
+_initialized_schemas = set()
+
+
+def _get_shared_graph(graph_store_config, max_connection_pool_size=None):
+    """
+    Returns the driver shared by every MemoryGraph with the same url, user, database, password and pool size.
+
+    The password is part of the key (as a digest), so a config never gets a driver authenticated with other
+    credentials. A driver that fails its connectivity check raises and is not registered.
+    """
+    password_digest = hashlib.sha256((graph_store_config.password or "").encode()).hexdigest()
+    key = (
+        graph_store_config.url,
+        graph_store_config.username,
+        graph_store_config.database,
+        password_digest,
+        max_connection_pool_size,
+    )
+    with _graphs_lock:
+        graph = _graphs.get(key)
+        if graph is not None:
+            return graph
+        graph_lock = _graph_locks.setdefault(key, threading.Lock())
+    # Connect outside the registry lock so other keys are not blocked behind the network round-trip
+    with graph_lock:
+        with _graphs_lock:
+            graph = _graphs.get(key)
+        if graph is None:
+            graph = _SharedGraph(
+                graph_store_config.url,
+                graph_store_config.username,
+                graph_store_config.password,
+                graph_store_config.database,
+                max_connection_pool_size,
+            )
+            with _graphs_lock:
+                _graphs[key] = graph
+        return graph
+
+
+def close_shared_graphs():
+    """
+    Closes every shared Neo4j driver. It runs automatically at interpreter exit.
+
+    MemoryGraph instances notice their closed driver and look up (or open) a new one on their next query.
+    """
+    with _graphs_lock:
+        graphs = list(_graphs.values())
+        _graphs.clear()
+        _initialized_schemas.clear()
+    for graph in graphs:
+        graph.close()
+
+
+atexit.register(close_shared_graphs)
+
+
+def _quantize_embedding(embedding, quantization):
+    """Pack an embedding into bytes at reduced precision. Returns (blob, scale); scale is None for float16."""
+    if quantization == "float16":
+        return struct.pack(f"<{len(embedding)}e", *embedding), None
+    scale = max((abs(x) for x in embedding), default=0.0) / 127 or 1.0
+    return array("b", (max(-127, min(127, round(x / scale))) for x in embedding)).tobytes(), scale
+
+
+def _dequantize_embedding(blob, quantization, scale=None):
+    """Unpack an embedding stored by `_quantize_embedding`."""
+    blob = bytes(blob)
+    if quantization == "float16":
+        return list(struct.unpack(f"<{len(blob) // 2}e", blob))
+    values = array("b")
+    values.frombytes(blob)
+    return [x * scale for x in values]
+
+
+def _cosine_similarity(a, b):
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
 class MemoryGraph:
-    def __init__(self, config):
+    def __init__(self, config, options=None):
         self.config = config
-        self.graph = Neo4jGraph(
-            self.config.graph_store.config.url,
-            self.config.graph_store.config.username,
-            self.config.graph_store.config.password,
-            self.config.graph_store.config.database,
-            refresh_schema=False,
-            driver_config={"notifications_min_severity": "OFF"},
-        )
-        self.embedding_model = EmbedderFactory.create(
-            self.config.embedder.provider, self.config.embedder.config, self.config.vector_store.config
-        )
+        self.options = options if isinstance(options, MemoryGraphOptions) else MemoryGraphOptions(**(options or {}))
         self.node_label = ":`__Entity__`" if self.config.graph_store.config.base_label else ""
 
-        if self.config.graph_store.config.base_label:
-            # Safely add user_id index
-            try:
-                self.graph.query(f"CREATE INDEX entity_single IF NOT EXISTS FOR (n {self.node_label}) ON (n.user_id)")
-            except Exception:
-                pass
-            try:  # Safely try to add composite index (Enterprise only)
-                self.graph.query(
-                    f"CREATE INDEX entity_composite IF NOT EXISTS FOR (n {self.node_label}) ON (n.name, n.user_id)"
-                )
-            except Exception:
-                pass
+        # The Neo4j connection, embedder and LLM clients are created on first use (see `_get_client`)
+        self._clients = {}
+        self._client_locks = {name: threading.Lock() for name in ("graph", "embedding_model", "llm")}
 
         self.llm_provider = "openai_structured"
         if self.config.llm.provider:
@@ -61,10 +209,128 @@ class MemoryGraph:
         if self.config.graph_store.llm:
             self.llm_provider = self.config.graph_store.llm.provider
 
-        self.llm = LlmFactory.create(self.llm_provider, self.config.llm.config)
         self.user_id = None
         self.threshold = 0.7
 
+        # Compact embedding storage: `embedding` keeps only the first `embedding_coarse_dims` dimensions
+        # (Matryoshka-style prefix) for the coarse cosine scan, and `embedding_q` keeps the full vector at
+        # reduced precision for exact re-scoring of the best coarse candidates.
+        self.embedding_quantization = self.options.embedding_quantization
+        self.embedding_coarse_dims = self.options.embedding_coarse_dims
+        self.embedding_rescore_candidates = self.options.embedding_rescore_candidates
+
+        if self.options.warm_up:
+            self.warm_up()
+
+    @property
+    def graph(self):
+        graph = self._clients.get("graph")
+        if isinstance(graph, _SharedGraph) and graph.closed:
+            # The shared driver was closed by close_shared_graphs(), look it up again
+            with self._client_locks["graph"]:
+                if self._clients.get("graph") is graph:
+                    del self._clients["graph"]
+        return self._get_client("graph", self._create_graph)
+
+    @graph.setter
+    def graph(self, graph):
+        self._clients["graph"] = graph
+
+    @property
+    def embedding_model(self):
+        return self._get_client(
+            "embedding_model",
+            lambda: EmbedderFactory.create(
+                self.config.embedder.provider, self.config.embedder.config, self.config.vector_store.config
+            ),
+        )
+
+    @embedding_model.setter
+    def embedding_model(self, embedding_model):
+        self._clients["embedding_model"] = embedding_model
+
+    @property
+    def llm(self):
+        return self._get_client("llm", lambda: LlmFactory.create(self.llm_provider, self.config.llm.config))
+
+    @llm.setter
+    def llm(self, llm):
+        self._clients["llm"] = llm
+
+    def _get_client(self, name, factory):
+        """Returns the client stored under `name`, creating it with `factory` on first use."""
+        client = self._clients.get(name)
+        if client is None:
+            with self._client_locks[name]:
+                client = self._clients.get(name)
+                if client is None:
+                    client = factory()
+                    self._clients[name] = client
+        return client
+
+    def warm_up(self, background=True):
+        """
+        Creates the Neo4j connection, embedder and LLM clients ahead of their first use.
+
+        Args:
+            background (bool): Create the clients in daemon threads instead of blocking. Defaults to True.
+
+        Returns:
+            list: The started threads, empty when `background` is False.
+        """
+        names = ("graph", "embedding_model", "llm")
+        if not background:
+            for name in names:
+                getattr(self, name)
+            return []
+
+        threads = [
+            threading.Thread(
+                target=self._warm_up_client, args=(name,), name=f"MemoryGraph-warm-up-{name}", daemon=True
+            )
+            for name in names
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def _warm_up_client(self, name):
+        try:
+            getattr(self, name)
+        except Exception as e:
+            logger.exception(f"Failed to warm up {name}: {e}")
+
+    def _create_graph(self):
+        graph = _get_shared_graph(self.config.graph_store.config, self.options.max_connection_pool_size)
+        if self.config.graph_store.config.base_label:
+            self._create_indexes(graph)
+        return graph
+
+    def _create_indexes(self, graph):
+        """Creates the entity indexes, once per process for each url, user and database."""
+        from neo4j.exceptions import Neo4jError
+
+        graph_store_config = self.config.graph_store.config
+        key = (graph_store_config.url, graph_store_config.username, graph_store_config.database)
+        with _graphs_lock:
+            schema_lock = _schema_locks.setdefault(key, threading.Lock())
+        with schema_lock:
+            if key in _initialized_schemas:
+                return
+            # Safely add user_id index; the next MemoryGraph retries if it fails
+            try:
+                graph.query(f"CREATE INDEX entity_single IF NOT EXISTS FOR (n {self.node_label}) ON (n.user_id)")
+            except Neo4jError as e:
+                logger.warning(f"Failed to create the entity_single index: {e}")
+                return
+            try:  # Safely try to add composite index (Enterprise only)
+                graph.query(
+                    f"CREATE INDEX entity_composite IF NOT EXISTS FOR (n {self.node_label}) ON (n.name, n.user_id)"
+                )
+            except Neo4jError:
+                pass
+            _initialized_schemas.add(key)
+
     def add(self, data, filters):
         """
         Adds data to the graph.
@@ -105,6 +371,11 @@ class MemoryGraph:
         if not search_output:
             return []
 
+        try:
+            from rank_bm25 import BM25Okapi
+        except ImportError:
+            raise ImportError("rank_bm25 is not installed. Please install it using pip install rank-bm25")
+
         search_outputs_sequence = [
             [item["source"], item["relationship"], item["destination"]] for item in search_output
         ]
@@ -159,7 +430,7 @@ class MemoryGraph:
         RETURN n.name AS source, type(r) AS relationship, m.name AS target
         LIMIT $limit
         """
-        results = self.graph.query(query, params=params)
+        results = self.graph.read_query(query, params=params)
 
         final_results = []
         for result in results:
@@ -258,12 +529,24 @@ class MemoryGraph:
         for node in node_list:
             n_embedding = self.embedding_model.embed(node)
 
-            cypher_query = f"""
+            if self.embedding_quantization:
+                candidates = self._search_similar_nodes(n_embedding, filters, self.threshold, limit)
+                if not candidates:
+                    continue
+                node_match = """
+            UNWIND $candidates AS candidate
+            MATCH (n)
+            WHERE elementId(n) = candidate.id
+            WITH n, candidate.similarity AS similarity"""
+            else:
+                node_match = f"""
             MATCH (n {self.node_label})
-            WHERE n.embedding IS NOT NULL AND n.user_id = $user_id
+            WHERE n.embedding IS NOT NULL AND n.embedding_q IS NULL AND n.user_id = $user_id
             {agent_filter}
             WITH n, round(2 * vector.similarity.cosine(n.embedding, $n_embedding) - 1, 4) AS similarity // denormalize for backward compatibility
-            WHERE similarity >= $threshold
+            WHERE similarity >= $threshold"""
+
+            cypher_query = f"""{node_match}
             CALL {{
                 MATCH (n)-[r]->(m)
                 WHERE m.user_id = $user_id {agent_filter.replace("n.", "m.")} 
@@ -287,8 +570,10 @@ class MemoryGraph:
             }
             if filters.get("agent_id"):
                 params["agent_id"] = filters["agent_id"]
+            if self.embedding_quantization:
+                params["candidates"] = candidates
 
-            ans = self.graph.query(cypher_query, params=params)
+            ans = self.graph.read_query(cypher_query, params=params)
             result_relations.extend(ans)
 
         return result_relations
@@ -418,6 +703,7 @@ class MemoryGraph:
                 WITH source, destination
                 CALL db.create.setNodeVectorProperty(destination, 'embedding', $destination_embedding)
                 WITH source, destination
+                {self._embedding_set_clause("destination", "destination_embedding")}
                 MERGE (source)-[r:{relationship}]->(destination)
                 ON CREATE SET 
                     r.created = timestamp(),
@@ -430,7 +716,7 @@ class MemoryGraph:
                 params = {
                     "source_id": source_node_search_result[0]["elementId(source_candidate)"],
                     "destination_name": destination,
-                    "destination_embedding": dest_embedding,
+                    **self._embedding_params("destination_embedding", dest_embedding),
                     "user_id": user_id,
                 }
                 if agent_id:
@@ -458,6 +744,7 @@ class MemoryGraph:
                 WITH source, destination
                 CALL db.create.setNodeVectorProperty(source, 'embedding', $source_embedding)
                 WITH source, destination
+                {self._embedding_set_clause("source", "source_embedding")}
                 MERGE (source)-[r:{relationship}]->(destination)
                 ON CREATE SET 
                     r.created = timestamp(),
@@ -470,7 +757,7 @@ class MemoryGraph:
                 params = {
                     "destination_id": destination_node_search_result[0]["elementId(destination_candidate)"],
                     "source_name": source,
-                    "source_embedding": source_embedding,
+                    **self._embedding_params("source_embedding", source_embedding),
                     "user_id": user_id,
                 }
                 if agent_id:
@@ -521,6 +808,7 @@ class MemoryGraph:
                 WITH source
                 CALL db.create.setNodeVectorProperty(source, 'embedding', $source_embedding)
                 WITH source
+                {self._embedding_set_clause("source", "source_embedding")}
                 MERGE (destination {destination_label} {{{dest_props_str}}})
                 ON CREATE SET destination.created = timestamp(),
                             destination.mentions = 1
@@ -529,6 +817,7 @@ class MemoryGraph:
                 WITH source, destination
                 CALL db.create.setNodeVectorProperty(destination, 'embedding', $dest_embedding)
                 WITH source, destination
+                {self._embedding_set_clause("destination", "dest_embedding")}
                 MERGE (source)-[rel:{relationship}]->(destination)
                 ON CREATE SET rel.created = timestamp(), rel.mentions = 1
                 ON MATCH SET rel.mentions = coalesce(rel.mentions, 0) + 1
@@ -538,8 +827,8 @@ class MemoryGraph:
                 params = {
                     "source_name": source,
                     "dest_name": destination,
-                    "source_embedding": source_embedding,
-                    "dest_embedding": dest_embedding,
+                    **self._embedding_params("source_embedding", source_embedding),
+                    **self._embedding_params("dest_embedding", dest_embedding),
                     "user_id": user_id,
                 }
                 if agent_id:
@@ -556,6 +845,12 @@ class MemoryGraph:
         return entity_list
 
     def _search_source_node(self, source_embedding, filters, threshold=0.9):
+        if self.embedding_quantization:
+            candidates = self._search_similar_nodes(
+                source_embedding, filters, threshold, self.embedding_rescore_candidates
+            )
+            return [{"elementId(source_candidate)": candidate["id"]} for candidate in candidates[:1]]
+
         agent_filter = ""
         if filters.get("agent_id"):
             agent_filter = "AND source_candidate.agent_id = $agent_id"
@@ -563,6 +858,7 @@ class MemoryGraph:
         cypher = f"""
             MATCH (source_candidate {self.node_label})
             WHERE source_candidate.embedding IS NOT NULL 
+            AND source_candidate.embedding_q IS NULL
             AND source_candidate.user_id = $user_id
             {agent_filter}
 
@@ -585,10 +881,16 @@ class MemoryGraph:
         if filters.get("agent_id"):
             params["agent_id"] = filters["agent_id"]
 
-        result = self.graph.query(cypher, params=params)
+        result = self.graph.read_query(cypher, params=params)
         return result
 
     def _search_destination_node(self, destination_embedding, filters, threshold=0.9):
+        if self.embedding_quantization:
+            candidates = self._search_similar_nodes(
+                destination_embedding, filters, threshold, self.embedding_rescore_candidates
+            )
+            return [{"elementId(destination_candidate)": candidate["id"]} for candidate in candidates[:1]]
+
         agent_filter = ""
         if filters.get("agent_id"):
             agent_filter = "AND destination_candidate.agent_id = $agent_id"
@@ -596,6 +898,7 @@ class MemoryGraph:
         cypher = f"""
             MATCH (destination_candidate {self.node_label})
             WHERE destination_candidate.embedding IS NOT NULL 
+            AND destination_candidate.embedding_q IS NULL
             AND destination_candidate.user_id = $user_id
             {agent_filter}
 
@@ -619,9 +922,169 @@ class MemoryGraph:
         if filters.get("agent_id"):
             params["agent_id"] = filters["agent_id"]
 
-        result = self.graph.query(cypher, params=params)
+        result = self.graph.read_query(cypher, params=params)
         return result
 
+    def _search_similar_nodes(self, embedding, filters, threshold, limit):
+        """
+        Finds nodes similar to `embedding` when compact embedding storage is enabled.
+
+        A coarse cosine scan over the truncated `embedding` prefix selects the best `limit` candidates, which
+        are then re-scored exactly against their reduced-precision `embedding_q`, or against their full
+        `embedding` for nodes that have not been migrated yet. The coarse scan compares the shorter of the
+        stored and the configured prefix, so nodes compacted with another `embedding_coarse_dims` still match.
+
+        Returns:
+            list: Dictionaries with "id" (element id) and "similarity", sorted by descending similarity.
+        """
+        agent_filter = ""
+        if filters.get("agent_id"):
+            agent_filter = "AND candidate.agent_id = $agent_id"
+
+        cypher = f"""
+            MATCH (candidate {self.node_label})
+            WHERE candidate.embedding IS NOT NULL
+            AND candidate.user_id = $user_id
+            {agent_filter}
+
+            WITH candidate, size(candidate.embedding) AS stored_dims
+            WITH candidate,
+            vector.similarity.cosine(
+                candidate.embedding[0..$coarse_dims], $coarse_embedding[0..stored_dims]
+            ) AS coarse_similarity
+            ORDER BY coarse_similarity DESC
+            LIMIT $limit
+
+            RETURN elementId(candidate) AS id,
+                CASE WHEN candidate.embedding_q IS NULL THEN candidate.embedding END AS embedding,
+                candidate.embedding_q AS embedding_q, candidate.embedding_scale AS embedding_scale,
+                candidate.embedding_q_type AS embedding_q_type
+            """
+
+        params = {
+            "coarse_embedding": embedding[: self.embedding_coarse_dims],
+            "coarse_dims": self.embedding_coarse_dims,
+            "user_id": filters["user_id"],
+            "limit": limit,
+        }
+        if filters.get("agent_id"):
+            params["agent_id"] = filters["agent_id"]
+
+        candidates = []
+        for row in self.graph.read_query(cypher, params=params):
+            similarity = round(_cosine_similarity(embedding, self._stored_embedding(row)), 4)
+            if similarity >= threshold:
+                candidates.append({"id": row["id"], "similarity": similarity})
+
+        candidates.sort(key=lambda candidate: candidate["similarity"], reverse=True)
+        return candidates
+
+    @staticmethod
+    def _stored_embedding(row):
+        """Full embedding of a node row: the dequantized `embedding_q` if present, else the `embedding` itself."""
+        if row["embedding_q"] is None:
+            return list(row["embedding"])
+        return _dequantize_embedding(row["embedding_q"], row["embedding_q_type"], row["embedding_scale"])
+
+    def _embedding_params(self, name, embedding):
+        """Builds the query parameters used to store `embedding` under the `$name` placeholders."""
+        if not self.embedding_quantization:
+            return {name: embedding}
+        if len(embedding) <= self.embedding_coarse_dims:
+            raise ValueError(
+                f"embedding_coarse_dims ({self.embedding_coarse_dims}) must be smaller than the embedding dimension "
+                f"({len(embedding)}), otherwise compact storage only adds `embedding_q` on top of the full vector."
+            )
+        embedding_q, embedding_scale = _quantize_embedding(embedding, self.embedding_quantization)
+        return {
+            name: embedding[: self.embedding_coarse_dims],
+            f"{name}_q": embedding_q,
+            f"{name}_scale": embedding_scale,
+            f"{name}_q_type": self.embedding_quantization,
+        }
+
+    def _embedding_set_clause(self, variable, name):
+        """
+        Cypher clause keeping the compact storage properties in line with a freshly written `embedding`.
+
+        It stores the reduced-precision embedding when compact storage is enabled, and otherwise removes the
+        properties left by an earlier compaction so the node is not mistaken for a compacted one.
+        """
+        if not self.embedding_quantization:
+            return f"REMOVE {variable}.embedding_q, {variable}.embedding_scale, {variable}.embedding_q_type"
+        return (
+            f"SET {variable}.embedding_q = ${name}_q, {variable}.embedding_scale = ${name}_scale, "
+            f"{variable}.embedding_q_type = ${name}_q_type"
+        )
+
+    def migrate_embedding_storage(self, batch_size=1000):
+        """
+        Converts stored entity embeddings to the layout selected by the current options, `batch_size` nodes at a time.
+
+        With compact storage enabled, full-precision nodes are compacted, and nodes compacted with another
+        quantization or `embedding_coarse_dims` are rebuilt from their `embedding_q`. With compact storage disabled,
+        compacted nodes get a full `embedding` rebuilt from `embedding_q`; the precision lost to quantization is
+        not recovered. Until that reverse migration runs, compacted nodes are left out of similarity searches.
+
+        Args:
+            batch_size (int): The number of nodes converted per query. Defaults to 1000.
+
+        Returns:
+            int: The number of migrated nodes.
+        """
+        if self.embedding_quantization:
+            pending = (
+                "n.embedding_q IS NULL OR n.embedding_q_type <> $quantization OR size(n.embedding) <> $coarse_dims"
+            )
+        else:
+            pending = "n.embedding_q IS NOT NULL"
+
+        # Collect the pending ids in a single scan, then load and convert the nodes by id batch by batch
+        ids_query = f"""
+        MATCH (n {self.node_label})
+        WHERE n.embedding IS NOT NULL AND ({pending})
+        RETURN elementId(n) AS id
+        """
+        fetch_query = """
+        UNWIND $ids AS id
+        MATCH (n)
+        WHERE elementId(n) = id
+        RETURN id, n.embedding AS embedding, n.embedding_q AS embedding_q,
+            n.embedding_scale AS embedding_scale, n.embedding_q_type AS embedding_q_type
+        """
+        update_query = """
+        UNWIND $batch AS row
+        MATCH (n)
+        WHERE elementId(n) = row.id
+        CALL db.create.setNodeVectorProperty(n, 'embedding', row.embedding)
+        WITH n, row
+        SET n.embedding_q = row.embedding_q,
+            n.embedding_scale = row.embedding_scale,
+            n.embedding_q_type = row.embedding_q_type
+        """
+
+        ids_params = {"quantization": self.embedding_quantization, "coarse_dims": self.embedding_coarse_dims}
+        ids = [row["id"] for row in self.graph.query(ids_query, params=ids_params)]
+
+        migrated = 0
+        for start in range(0, len(ids), batch_size):
+            batch = []
+            for row in self.graph.query(fetch_query, params={"ids": ids[start : start + batch_size]}):
+                batch.append(
+                    {
+                        "id": row["id"],
+                        "embedding_q": None,
+                        "embedding_scale": None,
+                        "embedding_q_type": None,
+                        **self._embedding_params("embedding", self._stored_embedding(row)),
+                    }
+                )
+            self.graph.query(update_query, params={"batch": batch})
+            migrated += len(batch)
+            logger.info(f"Migrated {migrated}/{len(ids)} entity embeddings")
+
+        return migrated
+
     # Reset is not defined in base.py
     def reset(self):
         """Reset the graph by clearing all nodes and relationships."""
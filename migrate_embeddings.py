@@ -0,0 +1,49 @@
+"""
+把 Neo4j 中已有实体节点的 embedding 转换成当前选项对应的存储格式，密码用环境变量 NEO4J_PASSWORD。
+
+    python migrate_embeddings.py --quantization int8 --coarse-dims 128   # 压缩存储
+    python migrate_embeddings.py                                         # 还原为完整 embedding（不可恢复量化损失）
+"""
+
+import argparse
+import os
+
+from mem0.configs.base import MemoryConfig
+
+from graph_memory import MemoryGraph
+
+parser = argparse.ArgumentParser(description="Migrate entity embeddings between full and compact storage")
+parser.add_argument("--url", default="bolt://localhost:7687")
+parser.add_argument("--username", default="neo4j")
+parser.add_argument("--database", default="neo4j")
+parser.add_argument("--base-label", action="store_true", help="entities use the __Entity__ base label")
+parser.add_argument("--quantization", choices=["float16", "int8"], help="omit to restore full embeddings")
+parser.add_argument("--coarse-dims", type=int, help="required with --quantization")
+parser.add_argument("--batch-size", type=int, default=1000)
+args = parser.parse_args()
+
+# 从环境变量获取 Neo4j 密码
+NEO4J_PASSWORD = os.environ.get("NEO4J_PASSWORD")
+if not NEO4J_PASSWORD:
+    raise ValueError("请先设置环境变量 NEO4J_PASSWORD！")
+
+config = MemoryConfig(
+    graph_store={
+        "provider": "neo4j",
+        "config": {
+            "url": args.url,
+            "username": args.username,
+            "password": NEO4J_PASSWORD,
+            "database": args.database,
+            "base_label": args.base_label,
+        },
+    }
+)
+
+options = {}
+if args.quantization or args.coarse_dims:
+    options = {"embedding_quantization": args.quantization, "embedding_coarse_dims": args.coarse_dims}
+
+graph = MemoryGraph(config, options=options)
+migrated = graph.migrate_embedding_storage(batch_size=args.batch_size)
+print(f"✅ 已迁移 {migrated} 个实体节点")
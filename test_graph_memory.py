@@ -0,0 +1,111 @@
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from graph_memory import (
+    MemoryGraph,
+    MemoryGraphOptions,
+    _cosine_similarity,
+    _dequantize_embedding,
+    _quantize_embedding,
+)
+
+EMBEDDING = [0.12, -0.5, 0.33, 0.0, 0.91, -0.07, 0.44, -0.88]
+
+
+def make_memory_graph(**options):
+    config = SimpleNamespace(
+        graph_store=SimpleNamespace(
+            config=SimpleNamespace(
+                url="bolt://localhost:7687", username="neo4j", password="test", database="neo4j", base_label=True
+            ),
+            llm=None,
+        ),
+        llm=SimpleNamespace(provider="openai", config={}),
+    )
+    return MemoryGraph(config, options=options)
+
+
+def test_float16_round_trip():
+    blob, scale = _quantize_embedding(EMBEDDING, "float16")
+
+    assert len(blob) == 2 * len(EMBEDDING)
+    assert scale is None
+    assert _dequantize_embedding(blob, "float16") == pytest.approx(EMBEDDING, abs=1e-3)
+
+
+def test_int8_round_trip():
+    blob, scale = _quantize_embedding(EMBEDDING, "int8")
+
+    assert len(blob) == len(EMBEDDING)
+    assert scale == pytest.approx(0.91 / 127)
+    # Neo4j returns byte array properties as bytearray
+    restored = _dequantize_embedding(bytearray(blob), "int8", scale)
+    assert restored == pytest.approx(EMBEDDING, abs=scale)
+    assert _cosine_similarity(EMBEDDING, restored) > 0.9999
+
+
+def test_int8_all_zero_embedding():
+    blob, scale = _quantize_embedding([0.0] * 4, "int8")
+
+    assert scale == 1.0
+    assert _dequantize_embedding(blob, "int8", scale) == [0.0] * 4
+
+
+def test_cosine_similarity():
+    assert _cosine_similarity(EMBEDDING, EMBEDDING) == pytest.approx(1.0)
+    assert _cosine_similarity([1.0, 0.0], [0.0, 2.0]) == 0.0
+    assert _cosine_similarity([1.0, 0.0], [-3.0, 0.0]) == pytest.approx(-1.0)
+    assert _cosine_similarity([0.0, 0.0], [1.0, 1.0]) == 0.0
+
+
+def test_options_default_to_full_precision():
+    options = MemoryGraphOptions()
+
+    assert options.embedding_quantization is None
+    assert options.embedding_coarse_dims is None
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"embedding_quantization": "float16"},
+        {"embedding_coarse_dims": 128},
+        {"embedding_quantization": "int4", "embedding_coarse_dims": 128},
+        {"embedding_quantization": "int8", "embedding_coarse_dims": 0},
+        {"embedding_quantisation": "int8", "embedding_coarse_dims": 128},
+    ],
+)
+def test_options_reject_invalid_compact_storage(options):
+    with pytest.raises(ValidationError):
+        MemoryGraphOptions(**options)
+
+
+def test_compact_embedding_params():
+    memory_graph = make_memory_graph(embedding_quantization="int8", embedding_coarse_dims=4)
+
+    params = memory_graph._embedding_params("embedding", EMBEDDING)
+
+    assert params["embedding"] == EMBEDDING[:4]
+    assert params["embedding_q_type"] == "int8"
+    assert _dequantize_embedding(params["embedding_q"], "int8", params["embedding_scale"]) == pytest.approx(
+        EMBEDDING, abs=params["embedding_scale"]
+    )
+    assert memory_graph._embedding_set_clause("n", "embedding").startswith("SET n.embedding_q = $embedding_q")
+
+
+def test_compact_embedding_params_reject_coarse_dims_not_below_dimension():
+    memory_graph = make_memory_graph(embedding_quantization="float16", embedding_coarse_dims=len(EMBEDDING))
+
+    with pytest.raises(ValueError, match="embedding_coarse_dims"):
+        memory_graph._embedding_params("embedding", EMBEDDING)
+
+
+def test_full_precision_write_clears_compact_properties():
+    memory_graph = make_memory_graph()
+
+    assert memory_graph._embedding_params("embedding", EMBEDDING) == {"embedding": EMBEDDING}
+    assert memory_graph._embedding_set_clause("n", "embedding") == (
+        "REMOVE n.embedding_q, n.embedding_scale, n.embedding_q_type"
+    )